@@ -1,13 +1,20 @@
 """
 Configuration management for Crossy application.
 """
+import os
+from functools import lru_cache
 from pathlib import Path
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 
-# Load environment variables from crossy/.env file
+# Load environment variables from crossy/.env file.
+# Guarded so repeated imports (e.g. across uvicorn workers or in tests)
+# don't re-parse the file.
 crossy_env_path = Path(__file__).parent.parent / ".env"
-load_dotenv(crossy_env_path)
+if not os.environ.get("CROSSY_ENV_LOADED"):
+    load_dotenv(crossy_env_path)
+    os.environ["CROSSY_ENV_LOADED"] = "1"
 
 
 class Settings(BaseSettings):
@@ -27,11 +34,17 @@ class Settings(BaseSettings):
     # Environment
     environment: str = "development"
     log_level: str = "INFO"
-    
+
+    _cors_origins: list[str] = PrivateAttr(default_factory=list)
+
+    def model_post_init(self, __context) -> None:
+        """Materialize derived values once at construction."""
+        self._cors_origins = [origin.strip() for origin in self.cors_origins_str.split(",")]
+
     @property
     def cors_origins(self) -> list[str]:
-        """Parse CORS origins from comma-separated string."""
-        return [origin.strip() for origin in self.cors_origins_str.split(",")]
+        """CORS origins parsed from the comma-separated string at init."""
+        return self._cors_origins
     
     class Config:
         env_file = str(crossy_env_path)
@@ -39,6 +52,12 @@ class Settings(BaseSettings):
         extra = "ignore"  # Ignore extra environment variables that aren't defined in the Settings class
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the application settings, constructed once per process."""
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
 
@@ -1,8 +1,10 @@
 """
 MongoDB database connection and operations using Motor (async driver).
 """
+import asyncio
 import logging
 from bson import ObjectId
+from pymongo import ReturnDocument
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from typing import Optional, List, Dict
 from .config import settings
@@ -10,11 +12,30 @@ from .config import settings
 logger = logging.getLogger(__name__)
 
 
+def _construct_trusted(model_cls, doc: Dict):
+    """
+    Build a Pydantic model from a document without re-running validation.
+
+    Invariant: documents read back from MongoDB were validated by this app
+    when they were written, so model_construct can skip the schema walk.
+    Untrusted input (API request bodies) must still go through model_validate.
+    """
+    return model_cls.model_construct(**doc)
+
+
 class MongoDB:
     """MongoDB connection manager."""
-    
+
     client: Optional[AsyncIOMotorClient] = None
     database: Optional[AsyncIOMotorDatabase] = None
+
+    # Per-collection projections for list views: only the fields the display
+    # label needs (plus _id) cross the wire instead of whole documents.
+    _LIST_PROJECTIONS = {
+        "vehicle": {"license_plate_number": 1, "owner_name": 1},
+        "crossing": {"timestamp": 1, "interior_checkpoints": 1},
+        "cargo_manifest": {"manifest_id": 1, "cargo_type": 1},
+    }
     
     async def connect(self):
         """Establish connection to MongoDB."""
@@ -24,13 +45,39 @@ class MongoDB:
             
             # Test the connection
             await self.client.admin.command('ping')
-            logger.info(f"Connected to MongoDB database: {settings.database_name}")
+            logger.info("Connected to MongoDB database: %s", settings.database_name)
             
         except Exception as e:
             logger.error(f"Failed to connect to MongoDB: {e}")
             self.client = None
             self.database = None
     
+    async def ensure_indexes(self):
+        """
+        Create the indexes the expected query patterns rely on (plate and
+        manifest lookups, checkpoint/time filtering). Safe to call on every
+        startup — create_index is a no-op when the index already exists, and
+        background=True keeps a large existing DB from blocking startup.
+        """
+        if self.database is None:
+            return
+
+        try:
+            await asyncio.gather(
+                self.database["crossing"].create_index(
+                    [("timestamp", -1), ("interior_checkpoints", 1)], background=True
+                ),
+                self.database["vehicle"].create_index(
+                    [("license_plate_number", 1)], background=True
+                ),
+                self.database["cargo_manifest"].create_index(
+                    [("manifest_id", 1)], background=True
+                ),
+            )
+            logger.info("Ensured MongoDB indexes")
+        except Exception as e:
+            logger.error(f"Failed to create indexes: {e}")
+
     async def disconnect(self):
         """Close MongoDB connection."""
         if self.client:
@@ -48,7 +95,16 @@ class MongoDB:
         except Exception as e:
             logger.error(f"MongoDB connection check failed: {e}")
             return False
-    
+
+    def has_connection(self) -> bool:
+        """
+        Cheap local check that a connection was established, without a server
+        ping. Route handlers use this as a fast-fail guard — the operation
+        itself surfaces any real connectivity error — while the health
+        endpoint still does a genuine round-trip via is_connected.
+        """
+        return self.client is not None and self.database is not None
+
     def get_collection(self, collection_name: str):
         """Get a MongoDB collection."""
         if self.database is None:
@@ -73,64 +129,159 @@ class MongoDB:
         result = await collection.insert_one(cargo_data)
         return str(result.inserted_id)
     
+    async def insert_record(self, vehicle_data: dict, crossing_data: dict,
+                            cargo_data: Optional[dict] = None) -> Dict[str, str]:
+        """
+        Insert one crossing record's documents across their collections as a
+        single batched call: the two or three inserts are submitted together
+        over the shared pool so the record costs one round-trip's worth of
+        latency. (A multi-document transaction would need a replica set,
+        which this demo doesn't assume.)
+        Returns the inserted ids keyed by collection name.
+        """
+        coros = [
+            self.get_collection("vehicle").insert_one(vehicle_data),
+            self.get_collection("crossing").insert_one(crossing_data),
+        ]
+        if cargo_data is not None:
+            coros.append(self.get_collection("cargo_manifest").insert_one(cargo_data))
+
+        results = await asyncio.gather(*coros)
+        inserted = {
+            "vehicle": str(results[0].inserted_id),
+            "crossing": str(results[1].inserted_id),
+        }
+        if cargo_data is not None:
+            inserted["cargo_manifest"] = str(results[2].inserted_id)
+        return inserted
+
+    async def bulk_insert(self, records: List[Dict]) -> Dict[str, List[str]]:
+        """
+        Insert a batch of crossing records with one insert_many per collection.
+
+        Each record is a dict with 'vehicle', 'crossing', and optional 'cargo'
+        keys (the shape produced by data_generator.generate_crossing_records).
+        Documents are grouped by collection in one pass and passed to
+        insert_many(ordered=False) as-is, so a batch of N records costs at
+        most three round-trips instead of 2N-3N.
+        Returns the inserted ids per collection as strings.
+        """
+        vehicles = []
+        crossings = []
+        cargos = []
+        for record in records:
+            vehicles.append(record["vehicle"])
+            crossings.append(record["crossing"])
+            if record.get("cargo"):
+                cargos.append(record["cargo"])
+
+        inserted = {"vehicle": [], "crossing": [], "cargo_manifest": []}
+        batches = [
+            ("vehicle", vehicles),
+            ("crossing", crossings),
+            ("cargo_manifest", cargos),
+        ]
+        pending = [(name, docs) for name, docs in batches if docs]
+        results = await asyncio.gather(*(
+            self.get_collection(name).insert_many(docs, ordered=False)
+            for name, docs in pending
+        ))
+        for (name, _), result in zip(pending, results):
+            inserted[name] = [str(obj_id) for obj_id in result.inserted_ids]
+
+        return inserted
+
     async def count_documents(self, collection_name: str) -> int:
         """
         Count total documents in a collection.
+        Uses estimated_document_count, which reads collection metadata in O(1)
+        instead of scanning the collection. Good enough for paging totals;
+        use exact_count_documents when an exact answer matters.
         """
-        if not await self.is_connected():
+        if self.database is None:
             raise RuntimeError("Database not connected")
-        
+
+        collection = self.get_collection(collection_name)
+        return await collection.estimated_document_count()
+
+    async def exact_count_documents(self, collection_name: str) -> int:
+        """
+        Count total documents in a collection exactly (full scan).
+        """
+        if self.database is None:
+            raise RuntimeError("Database not connected")
+
         collection = self.get_collection(collection_name)
         return await collection.count_documents({})
     
-    async def list_documents(self, collection_name: str, skip: int = 0, limit: int = 20) -> List[Dict]:
+    async def list_documents(self, collection_name: str, skip: int = 0, limit: int = 20,
+                             model_cls=None) -> List[Dict]:
         """
         List documents from a collection with their IDs and display labels.
         Supports pagination with skip and limit parameters.
         Returns list of dictionaries with _id and display_label fields.
+        If model_cls is given, each document is wrapped in that Pydantic model
+        via model_construct (no re-validation; see _construct_trusted).
+        """
+        documents = []
+        async for doc in self.iter_documents(collection_name, skip=skip, limit=limit):
+            if model_cls is not None:
+                documents.append(_construct_trusted(model_cls, doc))
+            else:
+                documents.append(doc)
+
+        return documents
+
+    async def iter_documents(self, collection_name: str, skip: int = 0, limit: int = 20):
         """
-        if not await self.is_connected():
+        Yield list-view documents one at a time as the cursor produces them.
+        Same projection, ordering, and display labels as list_documents, but
+        without buffering the page — the NDJSON streaming path sends each
+        document downstream as soon as it arrives.
+        """
+        if self.database is None:
             raise RuntimeError("Database not connected")
-        
+
         collection = self.get_collection(collection_name)
-        cursor = collection.find().skip(skip).limit(limit).sort("_id", -1)  # Sort by newest first
-        
-        documents = []
+        projection = self._LIST_PROJECTIONS.get(collection_name)
+        cursor = collection.find({}, projection).skip(skip).limit(limit).sort("_id", -1)  # Sort by newest first
+
         async for doc in cursor:
-            # Convert ObjectId to string
-            doc_dict = {**doc, "_id": str(doc["_id"])}
-            
+            # The cursor yields a fresh dict per document, so mutate in place
+            # instead of paying a shallow copy per row
+            doc["_id"] = str(doc["_id"])
+
             # Generate display label based on collection type
-            display_label = self._generate_display_label(collection_name, doc_dict)
-            doc_dict["display_label"] = display_label
-            
-            documents.append(doc_dict)
-        
-        return documents
+            doc["display_label"] = self._generate_display_label(collection_name, doc)
+
+            yield doc
     
-    async def get_document(self, collection_name: str, document_id: str) -> Optional[Dict]:
+    async def get_document(self, collection_name: str, document_id: str,
+                           model_cls=None) -> Optional[Dict]:
         """
         Retrieve a specific document by ID from a collection.
         Returns the document as a dictionary with _id converted to string, or None if not found.
+        If model_cls is given, the document is wrapped in that Pydantic model
+        via model_construct (no re-validation; see _construct_trusted).
         """
-        if not await self.is_connected():
+        if self.database is None:
             raise RuntimeError("Database not connected")
         
-        try:
-            # Convert string ID to ObjectId
-            obj_id = ObjectId(document_id)
-        except Exception as e:
-            logger.error(f"Invalid document ID format: {e}")
+        if not ObjectId.is_valid(document_id):
+            logger.error(f"Invalid document ID format: {document_id}")
             return None
+        obj_id = ObjectId(document_id)
         
         collection = self.get_collection(collection_name)
         doc = await collection.find_one({"_id": obj_id})
         
         if doc:
-            # Convert ObjectId to string
-            doc_dict = {**doc, "_id": str(doc["_id"])}
-            return doc_dict
-        
+            # Convert ObjectId to string in place (find_one returns a fresh dict)
+            doc["_id"] = str(doc["_id"])
+            if model_cls is not None:
+                return _construct_trusted(model_cls, doc)
+            return doc
+
         return None
     
     async def update_document(self, collection_name: str, document_id: str, document_data: dict) -> bool:
@@ -139,15 +290,13 @@ class MongoDB:
         Removes _id from document_data before updating to avoid conflicts.
         Returns True if document was updated, False if not found.
         """
-        if not await self.is_connected():
+        if self.database is None:
             raise RuntimeError("Database not connected")
         
-        try:
-            # Convert string ID to ObjectId
-            obj_id = ObjectId(document_id)
-        except Exception as e:
-            logger.error(f"Invalid document ID format: {e}")
-            raise ValueError(f"Invalid document ID format: {e}")
+        if not ObjectId.is_valid(document_id):
+            logger.error(f"Invalid document ID format: {document_id}")
+            raise ValueError(f"Invalid document ID format: {document_id}")
+        obj_id = ObjectId(document_id)
         
         # Remove _id from update data if present (we don't want to change it)
         update_data = {k: v for k, v in document_data.items() if k != "_id"}
@@ -159,35 +308,68 @@ class MongoDB:
         )
         
         if result.matched_count == 0:
-            logger.warning(f"Document {document_id} not found in collection {collection_name}")
+            logger.warning("Document %s not found in collection %s", document_id, collection_name)
             return False
         
-        logger.info(f"Updated document {document_id} in collection {collection_name}")
+        logger.info("Updated document %s in collection %s", document_id, collection_name)
         return True
     
+    async def update_and_get(self, collection_name: str, document_id: str,
+                             document_data: dict) -> Optional[Dict]:
+        """
+        Update a document and return its post-update state in one command.
+        find_one_and_update with ReturnDocument.AFTER fetches the new document
+        in the same round-trip, instead of update_one followed by find_one.
+        Removes _id from document_data before updating to avoid conflicts.
+        Returns the updated document with _id as a string, or None if not found.
+        """
+        if self.database is None:
+            raise RuntimeError("Database not connected")
+
+        if not ObjectId.is_valid(document_id):
+            logger.error(f"Invalid document ID format: {document_id}")
+            raise ValueError(f"Invalid document ID format: {document_id}")
+        obj_id = ObjectId(document_id)
+
+        # Remove _id from update data if present (we don't want to change it)
+        update_data = {k: v for k, v in document_data.items() if k != "_id"}
+
+        collection = self.get_collection(collection_name)
+        doc = await collection.find_one_and_update(
+            {"_id": obj_id},
+            {"$set": update_data},
+            return_document=ReturnDocument.AFTER
+        )
+
+        if doc is None:
+            logger.warning("Document %s not found in collection %s", document_id, collection_name)
+            return None
+
+        doc["_id"] = str(doc["_id"])
+        logger.info("Updated document %s in collection %s", document_id, collection_name)
+        return doc
+
     async def delete_document(self, collection_name: str, document_id: str) -> bool:
         """
         Delete a document from a collection by ID.
         Returns True if document was deleted, False if not found.
         """
-        if not await self.is_connected():
+        if self.database is None:
             raise RuntimeError("Database not connected")
         
-        try:
-            # Convert string ID to ObjectId
-            obj_id = ObjectId(document_id)
-        except Exception as e:
-            logger.error(f"Invalid document ID format: {e}")
-            raise ValueError(f"Invalid document ID format: {e}")
+        if not ObjectId.is_valid(document_id):
+            logger.error(f"Invalid document ID format: {document_id}")
+            raise ValueError(f"Invalid document ID format: {document_id}")
+        obj_id = ObjectId(document_id)
         
         collection = self.get_collection(collection_name)
         result = await collection.delete_one({"_id": obj_id})
         
         if result.deleted_count == 0:
-            logger.warning(f"Document {document_id} not found in collection {collection_name}")
+            logger.warning("Document %s not found in collection %s", document_id, collection_name)
             return False
         
-        logger.info(f"Deleted document {document_id} from collection {collection_name}")
+        logger.info("Deleted document %s from collection %s", document_id, collection_name)
         return True
     
     async def delete_all_documents(self, collection_name: str) -> int:
@@ -195,33 +377,37 @@ class MongoDB:
         Delete all documents from a collection.
         Returns the number of documents deleted.
         """
-        if not await self.is_connected():
+        if self.database is None:
             raise RuntimeError("Database not connected")
         
         collection = self.get_collection(collection_name)
         result = await collection.delete_many({})
         
         deleted_count = result.deleted_count
-        logger.info(f"Deleted {deleted_count} documents from collection {collection_name}")
+        logger.info("Deleted %d documents from collection %s", deleted_count, collection_name)
         return deleted_count
     
+    # Label formatters keyed by collection name: one hash lookup per document
+    # instead of a cascade of string comparisons.
+    _LABEL_FORMATTERS = {
+        "vehicle": lambda doc: (
+            f"{doc.get('license_plate_number', 'Unknown')} - {doc.get('owner_name', 'Unknown')}"
+        ),
+        "crossing": lambda doc: (
+            f"{doc.get('timestamp', 'Unknown')} - {doc.get('interior_checkpoints', 'Unknown')}"
+        ),
+        "cargo_manifest": lambda doc: (
+            f"{doc.get('manifest_id', 'Unknown')} - {doc.get('cargo_type', 'Unknown')}"
+        ),
+    }
+
     def _generate_display_label(self, collection_name: str, doc: Dict) -> str:
         """Generate a display label for a document based on its collection type."""
-        if collection_name == "vehicle":
-            license_plate = doc.get("license_plate_number", "Unknown")
-            owner = doc.get("owner_name", "Unknown")
-            return f"{license_plate} - {owner}"
-        elif collection_name == "crossing":
-            timestamp = doc.get("timestamp", "Unknown")
-            checkpoint = doc.get("interior_checkpoints", "Unknown")
-            return f"{timestamp} - {checkpoint}"
-        elif collection_name == "cargo_manifest":
-            manifest_id = doc.get("manifest_id", "Unknown")
-            cargo_type = doc.get("cargo_type", "Unknown")
-            return f"{manifest_id} - {cargo_type}"
-        else:
+        formatter = self._LABEL_FORMATTERS.get(collection_name)
+        if formatter is None:
             # Fallback: use _id
             return str(doc.get("_id", "Unknown"))
+        return formatter(doc)
 
 
 # Global MongoDB instance
@@ -10,6 +10,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from .config import settings
 from .database import mongodb
+from .models import SubmitRequest
 from .routes import router
 
 # Configure logging
@@ -27,8 +28,12 @@ async def lifespan(app: FastAPI):
     Lifespan context manager for startup and shutdown events.
     """
     # Startup
-    logger.info(f"Starting {settings.app_name} v{settings.app_version}")
+    logger.info("Starting %s v%s", settings.app_name, settings.app_version)
     await mongodb.connect()
+    await mongodb.ensure_indexes()
+    # Models use defer_build; force the hot submit schema now so the first
+    # request doesn't pay the core-schema build latency.
+    SubmitRequest.model_rebuild()
     yield
     # Shutdown
     logger.info("Shutting down application")
@@ -73,10 +78,15 @@ async def health():
 
 if __name__ == "__main__":
     import uvicorn
+    # uvicorn[standard] ships uvloop and httptools; "auto" picks the Cython
+    # event loop and HTTP parser wherever they're installed (uvloop doesn't
+    # exist on Windows, where auto falls back to asyncio)
     uvicorn.run(
         "backend.main:app",
         host=settings.api_host,
         port=settings.api_port,
+        loop="auto",
+        http="auto",
         reload=settings.environment == "development"
     )
 
@@ -3,16 +3,27 @@ Pydantic models for Crossy application data structures.
 """
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class RegistrationDetails(BaseModel):
+class _Base(BaseModel):
+    """
+    Shared base for all Crossy models.
+
+    defer_build postpones the Rust-core schema construction from import time
+    to first use, so models that a given process never validates (e.g. when
+    reads go through model_construct) cost nothing at startup.
+    """
+    model_config = ConfigDict(defer_build=True)
+
+
+class RegistrationDetails(_Base):
     """Vehicle registration details."""
     state: str = Field(..., description="Two-letter state abbreviation")
     expiration_date: str = Field(..., description="Registration expiration date (YYYY-MM-DD)")
 
 
-class VehicleDetails(BaseModel):
+class VehicleDetails(_Base):
     """Vehicle information for border crossing."""
     license_plate_number: str = Field(..., description="License plate in format XX-YYY-123")
     vehicle_type: str = Field(..., description="Type of vehicle: sedan, truck, motorcycle, tractor trailer, van")
@@ -20,8 +31,8 @@ class VehicleDetails(BaseModel):
     registration_details: RegistrationDetails
     passenger_count: int = Field(..., ge=0, description="Number of passengers (non-negative)")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "license_plate_number": "TX-ABC-123",
                 "vehicle_type": "truck",
@@ -33,9 +44,10 @@ class VehicleDetails(BaseModel):
                 "passenger_count": 2
             }
         }
+    )
 
 
-class CrossingEvent(BaseModel):
+class CrossingEvent(_Base):
     """Border crossing event information."""
     timestamp: str = Field(..., description="ISO 8601 timestamp")
     interior_checkpoints: str = Field(..., description="Name of interior checkpoint")
@@ -44,8 +56,8 @@ class CrossingEvent(BaseModel):
     crossing_purpose: str = Field(..., description="Purpose: personal, business, or shipping")
     secondary_inspection_flag: bool = Field(..., description="Whether secondary inspection is required")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "timestamp": "2025-10-30T13:10:00Z",
                 "interior_checkpoints": "Falfurrias",
@@ -55,17 +67,18 @@ class CrossingEvent(BaseModel):
                 "secondary_inspection_flag": True
             }
         }
+    )
 
 
-class CargoManifest(BaseModel):
+class CargoManifest(_Base):
     """Cargo manifest information (only for shipping crossings)."""
     manifest_id: str = Field(..., description="Manifest ID in SCAC format")
     cargo_type: str = Field(..., description="Type of cargo from predefined list")
     hazardous_material: bool = Field(..., description="Whether cargo contains hazardous materials")
     container_id: str = Field(..., description="10 alphanumeric container identifier")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "manifest_id": "ABCD2500123456",
                 "cargo_type": "Electronics",
@@ -73,16 +86,17 @@ class CargoManifest(BaseModel):
                 "container_id": "CONT33445X"
             }
         }
+    )
 
 
-class CrossingRecord(BaseModel):
+class CrossingRecord(_Base):
     """Complete crossing record with vehicle, event, and optional cargo data."""
     vehicle: VehicleDetails
     crossing: CrossingEvent
     cargo: Optional[CargoManifest] = None
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "vehicle": {
                     "license_plate_number": "TX-ABC-123",
@@ -105,16 +119,17 @@ class CrossingRecord(BaseModel):
                 "cargo": None
             }
         }
+    )
 
 
-class SubmitRequest(BaseModel):
+class SubmitRequest(_Base):
     """Request model for submitting crossing data."""
     vehicle: VehicleDetails
     crossing: CrossingEvent
     cargo: Optional[CargoManifest] = None
 
 
-class SubmitResponse(BaseModel):
+class SubmitResponse(_Base):
     """Response model for submit endpoint."""
     success: bool
     message: str
@@ -122,8 +137,7 @@ class SubmitResponse(BaseModel):
     mongodb_saved: bool = False
 
 
-class HealthResponse(BaseModel):
+class HealthResponse(_Base):
     """Response model for health check endpoint."""
     mongodb_connected: bool
     message: str
-
@@ -1,22 +1,113 @@
 """
 FastAPI routes for the Crossy application.
 """
-import json
+import asyncio
+import itertools
 import logging
 import os
-from datetime import datetime
+import re
+import time
 from pathlib import Path
-from fastapi import APIRouter, HTTPException, Depends
+
+import orjson
+
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from .models import (
-    CrossingRecord, SubmitRequest, SubmitResponse, 
-    HealthResponse, VehicleDetails, CrossingEvent, CargoManifest
+    CrossingRecord, SubmitRequest, SubmitResponse,
+    HealthResponse, RegistrationDetails, VehicleDetails, CrossingEvent, CargoManifest
 )
 from .database import MongoDB, get_database
 from . import data_generator
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api", tags=["api"])
+# ORJSONResponse serializes response payloads in C — this matters most for
+# list_collection_documents, which can return up to 100 documents per page
+router = APIRouter(prefix="/api", tags=["api"], default_response_class=ORJSONResponse)
+
+# Created once at import so submit requests skip the stat/mkdir syscalls
+DATA_DIR = Path("data")
+DATA_DIR.mkdir(exist_ok=True)
+
+# Valid MongoDB collection names: frozenset membership is O(1) and nothing
+# is allocated per request
+_VALID_COLLECTIONS = frozenset({"vehicle", "crossing", "cargo_manifest"})
+_VALID_COLLECTIONS_MSG = "Invalid collection name. Must be one of: vehicle, crossing, cargo_manifest"
+
+# Document ids are 24 hex chars; one precompiled fullmatch rejects malformed
+# ids at the route boundary before any database call
+_HEX24 = re.compile(r"[0-9a-fA-F]{24}").fullmatch
+
+
+def _dump_compact(data: dict) -> bytes:
+    """Serialize a payload compactly for response bodies."""
+    return orjson.dumps(data)
+
+
+# The enum endpoints serve reference data that never changes while the
+# process is up, so build the whole Response once at import time — body
+# bytes, content-type, content-length, and cache headers. The handlers hand
+# the same immutable object back on every request, skipping serialization
+# and response construction entirely. Clients may cache the payloads too.
+_ENUM_CACHE_HEADERS = {"Cache-Control": "public, max-age=3600"}
+
+def _enum_response(payload: dict) -> Response:
+    """Build a reusable prebuilt Response for a static reference payload."""
+    return Response(content=_dump_compact(payload), media_type="application/json",
+                    headers=_ENUM_CACHE_HEADERS)
+
+_CHECKPOINTS_RESPONSE = _enum_response({"checkpoints": data_generator.get_checkpoints()})
+_CARGO_TYPES_RESPONSE = _enum_response({"cargo_types": data_generator.get_cargo_types()})
+_VEHICLE_TYPES_RESPONSE = _enum_response({"vehicle_types": data_generator.get_vehicle_types()})
+_STATES_RESPONSE = _enum_response({"states": data_generator.get_us_states()})
+
+# Combined payload so the frontend can fetch all reference data in one
+# round-trip instead of four
+_ENUMS_RESPONSE = _enum_response({
+    "checkpoints": data_generator.get_checkpoints(),
+    "cargo_types": data_generator.get_cargo_types(),
+    "vehicle_types": data_generator.get_vehicle_types(),
+    "states": data_generator.get_us_states(),
+})
+
+
+def _write_all(writes) -> None:
+    """
+    Write pre-serialized (path, payload) pairs with raw os.open/os.write.
+
+    Runs in a worker thread as one batch, so a submit costs a single
+    thread-pool hop and the kernel can overlap the writes via the page cache.
+    (An io_uring submission would batch the syscalls too, but a liburing
+    dependency isn't warranted for this demo app.)
+    """
+    for path, payload in writes:
+        # O_EXCL: filenames are unique by construction (see _record_filename),
+        # so an existing file means a collision with another writer — fail
+        # loudly rather than clobber it
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+
+
+# Nanosecond timestamp plus a per-process counter: no two submits can produce
+# the same filename, even within the same second, without any stat/rename dance
+_seq = itertools.count()
+
+
+def _record_filename() -> str:
+    """Return a unique filename for a submitted record."""
+    return f"record_{time.time_ns()}_{next(_seq)}.json"
+
+
+def _dump_json(data: dict) -> bytes:
+    """
+    Serialize a payload for file storage (pretty-printed).
+    orjson serializes in C and returns bytes we can write in one call.
+    """
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
 
 
 @router.get("/health", response_model=HealthResponse)
@@ -41,13 +132,24 @@ async def generate_record():
     """
     try:
         record_data = data_generator.generate_crossing_record()
-        
-        # Convert to Pydantic models for validation
-        vehicle = VehicleDetails(**record_data["vehicle"])
-        crossing = CrossingEvent(**record_data["crossing"])
-        cargo = CargoManifest(**record_data["cargo"]) if record_data["cargo"] else None
-        
-        return CrossingRecord(
+
+        # The generator is trusted internal code, so wrap its output with
+        # model_construct and skip a redundant validation pass; validation
+        # still happens at the API boundary (SubmitRequest). Nested models
+        # must be constructed too — a plain dict in a model field makes the
+        # response serializer warn on every request.
+        vehicle_data = dict(record_data["vehicle"])
+        vehicle_data["registration_details"] = RegistrationDetails.model_construct(
+            **vehicle_data["registration_details"]
+        )
+        vehicle = VehicleDetails.model_construct(**vehicle_data)
+        crossing = CrossingEvent.model_construct(**record_data["crossing"])
+        cargo = (
+            CargoManifest.model_construct(**record_data["cargo"])
+            if record_data["cargo"] else None
+        )
+
+        return CrossingRecord.model_construct(
             vehicle=vehicle,
             crossing=crossing,
             cargo=cargo
@@ -61,77 +163,62 @@ async def generate_record():
 async def submit_record(request: SubmitRequest, db: MongoDB = Depends(get_database)):
     """
     Submit crossing record to both filesystem and MongoDB.
-    Creates separate JSON files for vehicle, crossing, and cargo (if present).
+    Writes one JSON file per record holding the vehicle, crossing, and cargo
+    (if present) payloads together — they belong to the same record, and one
+    file costs a third of the open/write/close and inode churn of three.
     """
     files_created = []
     mongodb_saved = False
     errors = []
-    
-    # Ensure data directory exists
-    data_dir = Path("data")
-    data_dir.mkdir(exist_ok=True)
-    
-    # Generate timestamp for filenames
-    timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    # Save to filesystem
-    try:
-        # Save vehicle data
-        vehicle_filename = f"vehicle_{timestamp_str}.json"
-        vehicle_path = data_dir / vehicle_filename
-        with open(vehicle_path, 'w') as f:
-            json.dump(request.vehicle.model_dump(), f, indent=2)
-        files_created.append(vehicle_filename)
-        logger.info(f"Saved vehicle data to {vehicle_path}")
-        
-        # Save crossing data
-        crossing_filename = f"crossing_{timestamp_str}.json"
-        crossing_path = data_dir / crossing_filename
-        with open(crossing_path, 'w') as f:
-            json.dump(request.crossing.model_dump(), f, indent=2)
-        files_created.append(crossing_filename)
-        logger.info(f"Saved crossing data to {crossing_path}")
-        
-        # Save cargo data if present
-        if request.cargo:
-            cargo_filename = f"cargo_manifest_{timestamp_str}.json"
-            cargo_path = data_dir / cargo_filename
-            with open(cargo_path, 'w') as f:
-                json.dump(request.cargo.model_dump(), f, indent=2)
-            files_created.append(cargo_filename)
-            logger.info(f"Saved cargo data to {cargo_path}")
-            
-    except Exception as e:
-        error_msg = f"Filesystem save error: {str(e)}"
-        logger.error(error_msg)
-        errors.append(error_msg)
-    
-    # Save to MongoDB
-    try:
-        if await db.is_connected():
-            # Insert vehicle
-            vehicle_id = await db.insert_vehicle(request.vehicle.model_dump())
-            logger.info(f"Inserted vehicle with ID: {vehicle_id}")
-            
-            # Insert crossing
-            crossing_id = await db.insert_crossing(request.crossing.model_dump())
-            logger.info(f"Inserted crossing with ID: {crossing_id}")
-            
-            # Insert cargo if present
-            if request.cargo:
-                cargo_id = await db.insert_cargo(request.cargo.model_dump())
-                logger.info(f"Inserted cargo with ID: {cargo_id}")
-            
-            mongodb_saved = True
-        else:
-            error_msg = "MongoDB not connected"
-            logger.warning(error_msg)
+
+    # Dump each submodel once; the filesystem and MongoDB paths share these
+    # dicts instead of walking the Pydantic tree twice
+    vehicle_data = request.vehicle.model_dump(mode='json')
+    crossing_data = request.crossing.model_dump(mode='json')
+    cargo_data = request.cargo.model_dump(mode='json') if request.cargo else None
+
+    async def save_files():
+        """Write the record's JSON file; appends to files_created/errors."""
+        try:
+            # Serialize up front so the worker thread only touches disk
+            record_path = DATA_DIR / _record_filename()
+            payload = _dump_json({
+                "vehicle": vehicle_data,
+                "crossing": crossing_data,
+                "cargo": cargo_data,
+            })
+
+            # One thread hop for the write; the loop stays responsive
+            await asyncio.to_thread(_write_all, [(record_path, payload)])
+            files_created.append(record_path.name)
+            logger.info("Saved submit data to %s", record_path)
+
+        except Exception as e:
+            error_msg = f"Filesystem save error: {str(e)}"
+            logger.error(error_msg)
             errors.append(error_msg)
-            
-    except Exception as e:
-        error_msg = f"MongoDB save error: {str(e)}"
-        logger.error(error_msg)
-        errors.append(error_msg)
+
+    async def save_mongo():
+        """Insert into MongoDB; sets mongodb_saved and appends to errors."""
+        nonlocal mongodb_saved
+        try:
+            if db.has_connection():
+                # One batched call covering all of the record's documents
+                inserted = await db.insert_record(vehicle_data, crossing_data, cargo_data)
+                logger.info("Inserted record with IDs: %s", inserted)
+                mongodb_saved = True
+            else:
+                error_msg = "MongoDB not connected"
+                logger.warning(error_msg)
+                errors.append(error_msg)
+
+        except Exception as e:
+            error_msg = f"MongoDB save error: {str(e)}"
+            logger.error(error_msg)
+            errors.append(error_msg)
+
+    # Overlap disk and network entirely; each branch records its own errors
+    await asyncio.gather(save_files(), save_mongo())
     
     # Determine success status
     success = len(files_created) > 0 or mongodb_saved
@@ -160,25 +247,35 @@ async def submit_record(request: SubmitRequest, db: MongoDB = Depends(get_databa
 @router.get("/checkpoints")
 async def get_checkpoints():
     """Return list of available Texas interior checkpoints."""
-    return {"checkpoints": data_generator.get_checkpoints()}
+    return _CHECKPOINTS_RESPONSE
 
 
 @router.get("/cargo-types")
 async def get_cargo_types():
     """Return list of available cargo types."""
-    return {"cargo_types": data_generator.get_cargo_types()}
+    return _CARGO_TYPES_RESPONSE
 
 
 @router.get("/vehicle-types")
 async def get_vehicle_types():
     """Return list of vehicle types."""
-    return {"vehicle_types": data_generator.get_vehicle_types()}
+    return _VEHICLE_TYPES_RESPONSE
 
 
 @router.get("/states")
 async def get_states():
     """Return list of US state abbreviations."""
-    return {"states": data_generator.get_us_states()}
+    return _STATES_RESPONSE
+
+
+@router.get("/enums")
+async def get_enums():
+    """
+    Return all reference lists (checkpoints, cargo types, vehicle types,
+    states) in a single response, so clients need one round-trip at page
+    load instead of four.
+    """
+    return _ENUMS_RESPONSE
 
 
 @router.get("/collections/{collection_name}")
@@ -186,19 +283,19 @@ async def list_collection_documents(
     collection_name: str,
     skip: int = 0,
     limit: int = 20,
+    format: str = "json",
     db: MongoDB = Depends(get_database)
 ):
     """
     List documents from a collection with pagination support.
     Returns paginated list of documents with _id and display_label fields.
+    With format=ndjson the page is streamed as newline-delimited JSON — a
+    metadata line followed by one document per line — so memory stays
+    bounded to a single document and the first bytes leave earlier.
     """
     # Validate collection name
-    valid_collections = ["vehicle", "crossing", "cargo_manifest"]
-    if collection_name not in valid_collections:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid collection name. Must be one of: {', '.join(valid_collections)}"
-        )
+    if collection_name not in _VALID_COLLECTIONS:
+        raise HTTPException(status_code=400, detail=_VALID_COLLECTIONS_MSG)
     
     # Validate pagination parameters
     if skip < 0:
@@ -207,7 +304,7 @@ async def list_collection_documents(
         raise HTTPException(status_code=400, detail="limit must be between 1 and 100")
     
     try:
-        if not await db.is_connected():
+        if not db.has_connection():
             raise HTTPException(
                 status_code=503,
                 detail="MongoDB is not connected"
@@ -215,8 +312,24 @@ async def list_collection_documents(
         
         # Get total count and paginated documents
         total_count = await db.count_documents(collection_name)
+
+        if format == "ndjson":
+            async def generate_ndjson():
+                # Header line carries the pagination metadata; each document
+                # follows on its own line as the Mongo cursor yields it
+                yield _dump_compact({
+                    "collection": collection_name,
+                    "total_count": total_count,
+                    "skip": skip,
+                    "limit": limit,
+                }) + b"\n"
+                async for doc in db.iter_documents(collection_name, skip=skip, limit=limit):
+                    yield _dump_compact(doc) + b"\n"
+
+            return StreamingResponse(generate_ndjson(), media_type="application/x-ndjson")
+
         documents = await db.list_documents(collection_name, skip=skip, limit=limit)
-        
+
         return {
             "collection": collection_name,
             "total_count": total_count,
@@ -243,15 +356,13 @@ async def get_collection_document(
     Returns the full document as JSON.
     """
     # Validate collection name
-    valid_collections = ["vehicle", "crossing", "cargo_manifest"]
-    if collection_name not in valid_collections:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid collection name. Must be one of: {', '.join(valid_collections)}"
-        )
+    if collection_name not in _VALID_COLLECTIONS:
+        raise HTTPException(status_code=400, detail=_VALID_COLLECTIONS_MSG)
+    if not _HEX24(document_id):
+        raise HTTPException(status_code=400, detail=f"Invalid document ID format: {document_id}")
     
     try:
-        if not await db.is_connected():
+        if not db.has_connection():
             raise HTTPException(
                 status_code=503,
                 detail="MongoDB is not connected"
@@ -279,39 +390,45 @@ async def get_collection_document(
 async def update_collection_document(
     collection_name: str,
     document_id: str,
-    document_data: dict,
+    request: Request,
     db: MongoDB = Depends(get_database)
 ):
     """
     Update an existing document in a collection.
     Accepts the updated document data as JSON and overwrites the existing document.
+    The body is parsed directly with orjson rather than going through the
+    framework's stdlib-json body parser, which matters for large documents.
     """
     # Validate collection name
-    valid_collections = ["vehicle", "crossing", "cargo_manifest"]
-    if collection_name not in valid_collections:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid collection name. Must be one of: {', '.join(valid_collections)}"
-        )
-    
+    if collection_name not in _VALID_COLLECTIONS:
+        raise HTTPException(status_code=400, detail=_VALID_COLLECTIONS_MSG)
+    if not _HEX24(document_id):
+        raise HTTPException(status_code=400, detail=f"Invalid document ID format: {document_id}")
+
+    body = await request.body()
     try:
-        if not await db.is_connected():
+        document_data = orjson.loads(body)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Request body is not valid JSON")
+    if not isinstance(document_data, dict):
+        raise HTTPException(status_code=400, detail="Request body must be a JSON object")
+
+    try:
+        if not db.has_connection():
             raise HTTPException(
                 status_code=503,
                 detail="MongoDB is not connected"
             )
         
-        # Update the document
-        updated = await db.update_document(collection_name, document_id, document_data)
-        
-        if not updated:
+        # Update and fetch the post-image in a single Mongo command
+        updated_document = await db.update_and_get(collection_name, document_id, document_data)
+
+        if updated_document is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Document with ID {document_id} not found in collection {collection_name}"
             )
-        
-        # Return the updated document
-        updated_document = await db.get_document(collection_name, document_id)
+
         return {
             "success": True,
             "message": f"Document {document_id} updated successfully",
@@ -338,15 +455,13 @@ async def delete_collection_document(
     Delete a document from a collection by ID.
     """
     # Validate collection name
-    valid_collections = ["vehicle", "crossing", "cargo_manifest"]
-    if collection_name not in valid_collections:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid collection name. Must be one of: {', '.join(valid_collections)}"
-        )
+    if collection_name not in _VALID_COLLECTIONS:
+        raise HTTPException(status_code=400, detail=_VALID_COLLECTIONS_MSG)
+    if not _HEX24(document_id):
+        raise HTTPException(status_code=400, detail=f"Invalid document ID format: {document_id}")
     
     try:
-        if not await db.is_connected():
+        if not db.has_connection():
             raise HTTPException(
                 status_code=503,
                 detail="MongoDB is not connected"
@@ -383,20 +498,23 @@ async def reset_collections(db: MongoDB = Depends(get_database)):
     This is a destructive operation that cannot be undone.
     """
     try:
-        if not await db.is_connected():
+        if not db.has_connection():
             raise HTTPException(
                 status_code=503,
                 detail="MongoDB is not connected"
             )
         
-        # Delete all documents from each collection
-        vehicle_count = await db.delete_all_documents("vehicle")
-        crossing_count = await db.delete_all_documents("crossing")
-        cargo_count = await db.delete_all_documents("cargo_manifest")
+        # The three deletes are independent, so submit them together and pay
+        # one round-trip's worth of latency instead of three
+        vehicle_count, crossing_count, cargo_count = await asyncio.gather(
+            db.delete_all_documents("vehicle"),
+            db.delete_all_documents("crossing"),
+            db.delete_all_documents("cargo_manifest"),
+        )
         
         total_deleted = vehicle_count + crossing_count + cargo_count
         
-        logger.info(f"Reset collections: deleted {vehicle_count} vehicles, {crossing_count} crossings, {cargo_count} cargo manifests")
+        logger.info("Reset collections: deleted %d vehicles, %d crossings, %d cargo manifests", vehicle_count, crossing_count, cargo_count)
         
         return {
             "success": True,
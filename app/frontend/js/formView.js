@@ -50,20 +50,12 @@ export class FormView {
     
     async populateDropdowns() {
         try {
-            // Fetch and populate states
-            const statesResponse = await fetch('/api/states');
-            const statesData = await statesResponse.json();
-            this.populateSelect(this.elements.registrationState, statesData.states);
-            
-            // Fetch and populate checkpoints
-            const checkpointsResponse = await fetch('/api/checkpoints');
-            const checkpointsData = await checkpointsResponse.json();
-            this.populateSelect(this.elements.checkpoint, checkpointsData.checkpoints);
-            
-            // Fetch and populate cargo types
-            const cargoResponse = await fetch('/api/cargo-types');
-            const cargoData = await cargoResponse.json();
-            this.populateSelect(this.elements.cargoType, cargoData.cargo_types);
+            // One round-trip for all reference lists
+            const enumsResponse = await fetch('/api/enums');
+            const enums = await enumsResponse.json();
+            this.populateSelect(this.elements.registrationState, enums.states);
+            this.populateSelect(this.elements.checkpoint, enums.checkpoints);
+            this.populateSelect(this.elements.cargoType, enums.cargo_types);
         } catch (error) {
             console.error('Error populating dropdowns:', error);
         }